@@ -238,11 +238,7 @@ class S3Client(NativeResource):
         assert isinstance(credential_provider, AwsCredentialsProvider) or credential_provider is None
         assert isinstance(tls_connection_options, TlsConnectionOptions) or tls_connection_options is None
         assert isinstance(part_size, int) or part_size is None
-        assert isinstance(
-            throughput_target_gbps,
-            int) or isinstance(
-            throughput_target_gbps,
-            float) or throughput_target_gbps is None
+        assert isinstance(throughput_target_gbps, (int, float)) or throughput_target_gbps is None
         assert isinstance(enable_s3express, bool) or enable_s3express is None
         assert isinstance(network_interface_names, Sequence) or network_interface_names is None
 
@@ -410,8 +406,9 @@ class S3Client(NativeResource):
                 If simply writing to a file, use `recv_filepath` instead of `on_body` for better performance.
                 The function should take the following arguments and return nothing:
 
-                    *   `chunk` (buffer): Response body data (not necessarily
-                        a whole "chunk" of chunked encoding).
+                    *   `chunk` (bytes): Response body data (not necessarily
+                        a whole "chunk" of chunked encoding). The data is a copy,
+                        so it may be kept after the callback returns.
 
                     *   `offset` (int): The offset of the chunk started in the whole body.
 
@@ -494,13 +491,16 @@ class S3Request(NativeResource):
         finished_future (concurrent.futures.Future): Future that will
             resolve when the s3 request has finished successfully.
             If the error happens, the Future will contain an exception
-            indicating why it failed. Note: Future will set before on_done invoked
+            indicating why it failed. Note: Future will set before on_done invoked.
+            The Future is created on first access, so requests that never read it
+            don't allocate one. Reading it costs a little extra (one shared lock)
+            compared to a Future created up front.
 
         shutdown_event (threading.Event): Signals when underlying threads and
             structures have all finished shutting down. Shutdown begins when the
             S3Request object is destroyed.
     """
-    __slots__ = ('_finished_future', 'shutdown_event')
+    __slots__ = ('_finished', 'shutdown_event')
 
     def __init__(
             self,
@@ -534,7 +534,7 @@ class S3Request(NativeResource):
 
         super().__init__()
 
-        self._finished_future = Future()
+        self._finished = _S3RequestFinished()
         self.shutdown_event = threading.Event()
 
         # C layer uses 0 to indicate defaults
@@ -554,7 +554,7 @@ class S3Request(NativeResource):
 
         s3_request_core = _S3RequestCore(
             request,
-            self._finished_future,
+            self._finished,
             self.shutdown_event,
             signing_config,
             credential_provider,
@@ -579,11 +579,12 @@ class S3Request(NativeResource):
             validate_response_checksum,
             part_size,
             multipart_upload_threshold,
+            on_body is not None,
             s3_request_core)
 
     @property
     def finished_future(self):
-        return self._finished_future
+        return self._finished.get_future()
 
     def cancel(self):
         _awscrt.s3_meta_request_cancel(self)
@@ -640,6 +641,45 @@ class _S3ClientCore:
         self._tls_connection_options = tls_connection_options
 
 
+# Guards lazy creation of _S3RequestFinished._future.
+# A single lock is shared so that requests don't each pay for their own.
+_finished_future_lock = threading.Lock()
+
+
+class _S3RequestFinished:
+    '''
+    Private class shared by S3Request and _S3RequestCore, holding the outcome of the request.
+    The finished future is only created if someone asks for it.
+    Until then, the outcome is stashed in _done/_error.
+    '''
+    __slots__ = ('_future', '_done', '_error')
+
+    def __init__(self):
+        self._future = None
+        self._done = False
+        self._error = None
+
+    def get_future(self):
+        future = self._future
+        if future is None:
+            with _finished_future_lock:
+                future = self._future
+                if future is None:
+                    future = Future()
+                    if self._done:
+                        _complete_future(future, self._error)
+                    self._future = future
+        return future
+
+    def set_done(self, error):
+        with _finished_future_lock:
+            self._error = error
+            self._done = True
+            future = self._future
+        if future is not None:
+            _complete_future(future, error)
+
+
 class _S3RequestCore:
     '''
     Private class to keep all the related Python object alive until C land clean up for S3Request
@@ -648,7 +688,7 @@ class _S3RequestCore:
     def __init__(
             self,
             request,
-            finish_future,
+            finished,
             shutdown_event,
             signing_config=None,
             credential_provider=None,
@@ -668,7 +708,7 @@ class _S3RequestCore:
         self._on_done_cb = on_done
         self._on_progress_cb = on_progress
 
-        self._finished_future = finish_future
+        self._finished = finished
         self._shutdown_event = shutdown_event
 
     def _on_headers(self, status_code, headers):
@@ -724,9 +764,8 @@ class _S3RequestCore:
                         headers=error_headers,
                         body=error_body,
                         operation_name=error_operation_name)
-            self._finished_future.set_exception(error)
-        else:
-            self._finished_future.set_result(None)
+
+        self._finished.set_done(error)
 
         if checksum_validation_algorithm:
             checksum_validation_algorithm = S3ChecksumAlgorithm(checksum_validation_algorithm)
@@ -748,6 +787,13 @@ class _S3RequestCore:
             self._on_progress_cb(progress)
 
 
+def _complete_future(future, error):
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+
+
 def create_default_s3_signing_config(*, region: str, credential_provider: AwsCredentialsProvider, **kwargs):
     """Create a default `AwsSigningConfig` for S3 service.
 
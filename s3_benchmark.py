@@ -156,16 +156,16 @@ completed = repeat_times * bunch_size
 
 for i in range(0, repeat_times):
     futures = []
-    s3_requests = []
     for j in range(0, bunch_size):
-
-        s3_requests.append(s3_client.make_request(
+        # The request keeps going even if the S3Request is garbage collected,
+        # so only its future needs to be kept around.
+        s3_request = s3_client.make_request(
             request=request,
             type=S3RequestType.GET_OBJECT,
             on_body=on_body,
-            on_done=on_done))
+            on_done=on_done)
 
-        futures.append(s3_requests[j].finished_future)
+        futures.append(s3_request.finished_future)
     for j in futures:
         try:
             j.result(100000)
@@ -24,6 +24,9 @@ struct s3_meta_request_binding {
     /* Reference to python object that reference to other related python object to keep it alive */
     PyObject *py_core;
 
+    /* Whether Python has an on_body callback. If not, body data is dropped without taking the GIL */
+    bool has_on_body;
+
     /* Batch up the transferred size in one sec. */
     uint64_t size_transferred;
     /* The time stamp when the progress reported */
@@ -139,6 +142,10 @@ static int s_s3_request_on_body(
     void *user_data) {
     (void)meta_request;
     struct s3_meta_request_binding *request_binding = user_data;
+    if (!request_binding->has_on_body) {
+        return AWS_OP_SUCCESS;
+    }
+
     bool error = true;
     /*************** GIL ACQUIRE ***************/
     PyGILState_STATE state;
@@ -332,10 +339,11 @@ PyObject *aws_py_s3_client_make_meta_request(PyObject *self, PyObject *args) {
     int validate_response_checksum;                    /* p - boolean predicate */
     uint64_t part_size;                                /* K */
     uint64_t multipart_upload_threshold;               /* K */
+    int has_on_body;                                   /* p - boolean predicate */
     PyObject *py_core;                                 /* O */
     if (!PyArg_ParseTuple(
             args,
-            "OOOizOOzzs#iipKKO",
+            "OOOizOOzzs#iipKKpO",
             &py_s3_request,
             &s3_client_py,
             &http_request_py,
@@ -352,6 +360,7 @@ PyObject *aws_py_s3_client_make_meta_request(PyObject *self, PyObject *args) {
             &validate_response_checksum,
             &part_size,
             &multipart_upload_threshold,
+            &has_on_body,
             &py_core)) {
         return NULL;
     }
@@ -410,6 +419,7 @@ PyObject *aws_py_s3_client_make_meta_request(PyObject *self, PyObject *args) {
 
     meta_request->py_core = py_core;
     Py_INCREF(meta_request->py_core);
+    meta_request->has_on_body = has_on_body != 0;
 
     struct aws_s3_meta_request_options s3_meta_request_opt = {
         .type = type,
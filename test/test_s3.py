@@ -8,6 +8,7 @@ import os
 import tempfile
 import math
 import shutil
+import threading
 import time
 from test import NativeResourceTest
 from concurrent.futures import Future
@@ -25,6 +26,8 @@ from awscrt.s3 import (
     CrossProcessLock,
     create_default_s3_signing_config,
     get_optimized_platforms,
+    _S3RequestCore,
+    _S3RequestFinished,
 )
 from awscrt.io import (
     ClientBootstrap,
@@ -195,15 +198,17 @@ def s3_client_new(
 
 
 class FakeReadStream(object):
+    # shared fake data, handed out in slices so reads don't allocate
+    _fake_data = memoryview(b'x' * MB)
+
     def __init__(self, read_future):
         self._future = read_future
 
     def read(self, length):
-        fake_string = "x" * length
-        fake_data = bytes(fake_string, 'utf-8')
         if not self._future.done():
             self._future.set_result(None)
-        return fake_data
+        # short reads are fine, the caller keeps reading until it has enough
+        return self._fake_data[:length]
 
 
 class S3ClientTest(NativeResourceTest):
@@ -239,6 +244,41 @@ class S3ClientTest(NativeResourceTest):
         self.assertTrue("p4d.24xlarge" in platform_list)
 
 
+class S3RequestFinishedTest(NativeResourceTest):
+    # The finished future is created lazily, exercise it without making a real request.
+
+    def _new_request_core(self):
+        finished = _S3RequestFinished()
+        core = _S3RequestCore(None, finished, threading.Event())
+        return core, finished
+
+    def _finish(self, core, error_code=0):
+        core._on_finish(error_code, 200, None, None, None, False, 0)
+
+    def test_future_requested_before_finish(self):
+        core, finished = self._new_request_core()
+        future = finished.get_future()
+        self.assertFalse(future.done())
+        self._finish(core)
+        self.assertIsNone(future.result(0))
+        self.assertIs(future, finished.get_future())
+
+    def test_future_requested_after_finish(self):
+        core, finished = self._new_request_core()
+        self._finish(core)
+        future = finished.get_future()
+        self.assertIsNone(future.result(0))
+        self.assertIs(future, finished.get_future())
+
+    def test_future_requested_after_failure(self):
+        core, finished = self._new_request_core()
+        # error code 1 is AWS_ERROR_OOM, which becomes MemoryError
+        self._finish(core, error_code=1)
+        future = finished.get_future()
+        self.assertIsInstance(future.exception(0), MemoryError)
+        self.assertIs(future, finished.get_future())
+
+
 @unittest.skipUnless(os.environ.get('AWS_TEST_S3'), 'set env var to run test: AWS_TEST_S3')
 class S3RequestTest(NativeResourceTest):
     def setUp(self):
@@ -332,7 +372,9 @@ class S3RequestTest(NativeResourceTest):
     def _on_progress(self, progress):
         self.transferred_len += progress
 
-    def _validate_successful_response(self, is_put_object):
+    def _validate_successful_response(self, is_put_object, received_body_len=None):
+        if received_body_len is None:
+            received_body_len = self.received_body_len
         self.assertEqual(self.response_status_code, 200, "status code is not 200")
         self.assertEqual(self.done_status_code, self.response_status_code,
                          "status-code from on_done doesn't match code from on_headers")
@@ -353,7 +395,7 @@ class S3RequestTest(NativeResourceTest):
         if body_length:
             self.assertEqual(
                 int(body_length),
-                self.received_body_len,
+                received_body_len,
                 "Received body length does not match the Content-Length header")
 
     def _test_s3_put_get_object(
@@ -364,24 +406,27 @@ class S3RequestTest(NativeResourceTest):
             enable_s3express=False,
             region="us-west-2",
             mem_limit=None,
+            s3_client=None,
             **kwargs):
-        s3_client = s3_client_new(
-            False,
-            region,
-            5 * MB,
-            enable_s3express=enable_s3express,
-            mem_limit=mem_limit)
+        if s3_client is None:
+            s3_client = s3_client_new(
+                False,
+                region,
+                5 * MB,
+                enable_s3express=enable_s3express,
+                mem_limit=mem_limit)
         signing_config = None
         if enable_s3express:
             signing_config = AwsSigningConfig(
                 algorithm=AwsSigningAlgorithm.V4_S3EXPRESS)
+        on_body = kwargs.pop('on_body', self._on_request_body)
 
         s3_request = s3_client.make_request(
             request=request,
             type=request_type,
             signing_config=signing_config,
             on_headers=self._on_request_headers,
-            on_body=self._on_request_body,
+            on_body=on_body,
             on_done=self._on_request_done,
             **kwargs)
 
@@ -392,7 +437,9 @@ class S3RequestTest(NativeResourceTest):
 
         if exception_name is None:
             finished_future.result()
-            self._validate_successful_response(request_type is S3RequestType.PUT_OBJECT)
+            # without on_body, reported progress is the only count of body received
+            received_body_len = None if on_body else self.transferred_len
+            self._validate_successful_response(request_type is S3RequestType.PUT_OBJECT, received_body_len)
         else:
             e = finished_future.exception()
             self.assertEqual(e.name, exception_name)
@@ -402,26 +449,50 @@ class S3RequestTest(NativeResourceTest):
         request = self._get_object_request(self.get_test_object_path)
         self._test_s3_put_get_object(request, S3RequestType.GET_OBJECT)
 
+    def test_get_object_keep_body_chunks(self):
+        # on_body receives bytes, which stay valid after the callback returns
+        chunks = []
+
+        def _on_body(chunk, offset, **kwargs):
+            self.assertIsInstance(chunk, bytes)
+            chunks.append((offset, chunk))
+
+        request = self._get_object_request(self.get_test_object_path)
+        s3_client = s3_client_new(False, self.region, 5 * MB)
+        s3_request = s3_client.make_request(
+            request=request,
+            type=S3RequestType.GET_OBJECT,
+            on_headers=self._on_request_headers,
+            on_body=_on_body)
+        finished_future = s3_request.finished_future
+        shutdown_event = s3_request.shutdown_event
+        s3_request = None
+        self.assertTrue(shutdown_event.wait(self.timeout))
+        finished_future.result()
+
+        body = b''.join(chunk for offset, chunk in sorted(chunks, key=lambda c: c[0]))
+        self.assertEqual(len(body), int(HttpHeaders(self.response_headers).get("Content-Length")))
+
     def test_get_object_mem_limit(self):
         request = self._get_object_request(self.get_test_object_path)
         self._test_s3_put_get_object(request, S3RequestType.GET_OBJECT, mem_limit=2 * GB)
 
     def test_put_object(self):
-        put_body_stream = open(self.temp_put_obj_file_path, "rb")
+        put_body_stream = open(self.temp_put_obj_file_path, "rb", buffering=0)
         content_length = os.stat(self.temp_put_obj_file_path).st_size
         request = self._put_object_request(put_body_stream, content_length)
         self._test_s3_put_get_object(request, S3RequestType.PUT_OBJECT)
         put_body_stream.close()
 
     def test_put_object_mem_limit(self):
-        put_body_stream = open(self.temp_put_obj_file_path, "rb")
+        put_body_stream = open(self.temp_put_obj_file_path, "rb", buffering=0)
         content_length = os.stat(self.temp_put_obj_file_path).st_size
         request = self._put_object_request(put_body_stream, content_length)
         self._test_s3_put_get_object(request, S3RequestType.PUT_OBJECT, mem_limit=2 * GB)
         put_body_stream.close()
 
     def test_put_object_unknown_content_length(self):
-        put_body_stream = open(self.temp_put_obj_file_path, "rb")
+        put_body_stream = open(self.temp_put_obj_file_path, "rb", buffering=0)
         content_length = os.stat(self.temp_put_obj_file_path).st_size
         request = self._put_object_request(put_body_stream, content_length, unknown_content_length=True)
         self._test_s3_put_get_object(request, S3RequestType.PUT_OBJECT)
@@ -439,7 +510,7 @@ class S3RequestTest(NativeResourceTest):
         self._test_s3_put_get_object(request, S3RequestType.GET_OBJECT, enable_s3express=True, region="us-east-1")
 
     def test_put_object_s3express(self):
-        put_body_stream = open(self.temp_put_obj_file_path, "rb")
+        put_body_stream = open(self.temp_put_obj_file_path, "rb", buffering=0)
         content_length = os.stat(self.temp_put_obj_file_path).st_size
         request = self._put_object_request(put_body_stream, content_length, enable_s3express=True)
         self._test_s3_put_get_object(request, S3RequestType.PUT_OBJECT, enable_s3express=True, region="us-east-1")
@@ -545,6 +616,12 @@ class S3RequestTest(NativeResourceTest):
             # TODO verify the content of written file
             os.remove(file.name)
 
+    def test_get_object_no_on_body(self):
+        # Without on_body, body data is dropped in C without calling into Python.
+        # The download must still complete, with progress covering the whole body.
+        request = self._get_object_request(self.get_test_object_path)
+        self._test_s3_put_get_object(request, S3RequestType.GET_OBJECT, on_body=None, on_progress=self._on_progress)
+
     def test_put_object_filepath(self):
         content_length = os.stat(self.temp_put_obj_file_path).st_size
         request = self._put_object_request(None, content_length)
@@ -598,12 +675,16 @@ class S3RequestTest(NativeResourceTest):
         crc32_base64_bytes = base64.urlsafe_b64encode(crc32_big_endian)
         crc32_base64_str = crc32_base64_bytes.decode()
 
+        # upload and download share one client
+        s3_client = s3_client_new(False, self.region, 5 * MB)
+
         # upload, with client adding checksum
         upload_request = self._put_object_request(put_body_stream, content_length, path=path)
         upload_checksum_config = S3ChecksumConfig(
             algorithm=S3ChecksumAlgorithm.CRC32,
             location=S3ChecksumLocation.TRAILER)
         self._test_s3_put_get_object(upload_request, S3RequestType.PUT_OBJECT,
+                                     s3_client=s3_client,
                                      checksum_config=upload_checksum_config)
         self.assertEqual(HttpHeaders(self.response_headers).get('x-amz-checksum-crc32'),
                          crc32_base64_str)
@@ -612,6 +693,7 @@ class S3RequestTest(NativeResourceTest):
         download_request = self._get_object_request(path)
         download_checksum_config = S3ChecksumConfig(validate_response=True)
         self._test_s3_put_get_object(download_request, S3RequestType.GET_OBJECT,
+                                     s3_client=s3_client,
                                      checksum_config=download_checksum_config)
         self.assertTrue(self.done_did_validate_checksum)
         self.assertEqual(self.done_checksum_validation_algorithm, S3ChecksumAlgorithm.CRC32)
@@ -715,7 +797,7 @@ class S3RequestTest(NativeResourceTest):
         # need to do single-part upload so the Content-MD5 header is sent along as-is.
         content_length = 100
         file_path = self.files.create_file_with_size("temp_file", content_length)
-        put_body_stream = open(file_path, "r+b")
+        put_body_stream = open(file_path, "r+b", buffering=0)
         request = self._put_object_request(put_body_stream, content_length)
         request.headers.set("Content-MD5", "something")
         self._test_s3_put_get_object(request, S3RequestType.PUT_OBJECT, "AWS_ERROR_S3_INVALID_RESPONSE_STATUS")